@@ -1,22 +1,37 @@
 import numpy as np
-from scipy.optimize import fsolve
 
 # Constants
 MASS_ELECTRON_MEV = 0.51099895000  # CODATA
 N_ELECTRON = 3  # Our established anchor
 
+def newton_drift(N, tol=1e-14):
+    """
+    Newton iteration on Jose's Stability Equation, starting at m = 1/(pi*(N - 1/2)).
+    With arccos(-m) = pi - arccos(m) the residual reads
+    f(m) = sqrt(1 - m^2) - m * (pi*(N-1) + arccos(m)) and f'(m) = -(pi*(N-1) + arccos(m)),
+    so each step costs one sqrt and one arccos. A handful of scalar steps is far
+    cheaper than a general-purpose solver for 3 calls.
+    Matter states (N >= 2) converge in at most 4 steps. The photon root m = 1
+    (N=1) is degenerate, so it is returned in closed form.
+    """
+    if N == 1:
+        return 1.0
+    m = 1.0 / (np.pi * (N - 0.5))
+    for _ in range(10):
+        s = np.sqrt(1 - m**2)
+        g = np.pi * (N - 1) + np.arccos(m)
+        step = (m * g - s) / g
+        m -= step
+        if abs(step) < tol:
+            break
+    return m
+
 def solve_for_mass_proxy(N):
     """
     Solves Jose's Stability Equation and applies Scaling Hypothesis:
     Mass ~ N * sqrt(1 - m^2)
     """
-    def equation(m):
-        if abs(m) > 1: return 100 
-        return np.sqrt(1 - m**2) - m * (np.pi * N - np.arccos(-m))
-
-    guess = 1.0 / (np.pi * N)
-    root = fsolve(equation, guess)
-    m = root[0]
+    m = newton_drift(N)
     
     # The Scaling Hypothesis
     return N * np.sqrt(1 - m**2)
@@ -1,6 +1,9 @@
+import argparse
+
+import matplotlib
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.collections import LineCollection
+
+from plots import get_fig
 
 class GravityRiverModel:
     """
@@ -13,7 +16,7 @@ class GravityRiverModel:
         self.C = 1.0
         self.Rs = 1.0 # Schwarzschild Radius
 
-    def visualize_river_mechanics(self):
+    def visualize_river_mechanics(self, dpi=150, fmt='pdf'):
         print("\nGenerating Figure 8: Gravity River Mechanics...")
 
         # --- 1. Setup the River Field ---
@@ -35,8 +38,8 @@ class GravityRiverModel:
 
         # --- 3. Visualization ---
         # Use a style suitable for academic papers
-        plt.rcParams['font.family'] = 'sans-serif'
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        matplotlib.rcParams['font.family'] = 'sans-serif'
+        fig, (ax1, ax2) = get_fig(1, 2, figsize=(14, 6))
 
         # --- Plot 1: The Velocity Field (Physical Space) ---
         ax1.plot(r/self.Rs, v_flow, 'b-', linewidth=2.5, label=r'River Velocity $v_{flow}$')
@@ -73,19 +76,35 @@ class GravityRiverModel:
         A = self.C / k # Strict Mode Constraint
         m = v_swim # The swim speed IS the drift m
 
+        # Phase argument shared by sin and cos (computed once)
+        kt = k * t
+
         # Wave function in the Swimmer's Frame: y = A sin(kt) + mt
-        y = A * np.sin(k * t) + m * t
+        y = A * np.sin(kt) + m * t
 
         # Calculate derivative to color the stitch
         # y' = A*k*cos(kt) + m
-        y_prime = A * k * np.cos(k * t) + m
-
-        points = np.array([t, y]).T.reshape(-1, 1, 2)
-        segments = np.concatenate([points[:-1], points[1:]], axis=1)
-        colors = ['orange' if yp < 0 else 'blue' for yp in y_prime[:-1]]
-
-        lc = LineCollection(segments, colors=colors, linewidth=3)
-        ax2.add_collection(lc)
+        y_prime = A * k * np.cos(kt) + m
+
+        # One sign mask drives both the stitch coloring and the ratio below
+        # (y' == 0 exactly is measure-zero for this signal)
+        pos_mask = y_prime > 0
+
+        # Shade the Hidden (Orange) intervals analytically instead of coloring
+        # every segment: y' < 0 <=> cos(kt) < -m/(A*k), i.e.
+        # kt in (phi + 2*pi*n, 2*pi - phi + 2*pi*n) with phi = arccos(-m/(A*k))
+        # Clamping covers the degenerate drifts: phi = pi (never Hidden) gives
+        # empty bands, phi = 0 (always Hidden) gives back-to-back full periods
+        phi = np.arccos(np.clip(-m / (A * k), -1.0, 1.0))
+        for n in range(int(np.ceil(k * t[-1] / (2 * np.pi)))):
+            t_start = max((phi + 2 * np.pi * n) / k, t[0])
+            t_stop = min((2 * np.pi - phi + 2 * np.pi * n) / k, t[-1])
+            if t_start < t_stop:
+                ax2.axvspan(t_start, t_stop, color='orange', alpha=0.2, linewidth=0)
+
+        # Draw the stitch once in blue, then overlay the Hidden parts in orange
+        ax2.plot(t, y, 'b-', linewidth=3)
+        ax2.plot(t, np.where(pos_mask, np.nan, y), color='orange', linewidth=3)
         ax2.set_xlim(0, 3)
         ax2.set_ylim(np.min(y), np.max(y))
 
@@ -95,8 +114,8 @@ class GravityRiverModel:
         ax2.grid(True, alpha=0.3)
 
         # Annotations for ratio
-        blue_len = np.sum(y_prime > 0)
-        orange_len = np.sum(y_prime < 0)
+        blue_len = int(pos_mask.sum())
+        orange_len = len(y_prime) - blue_len
 
         if orange_len > 0:
             ratio = blue_len / orange_len
@@ -111,10 +130,15 @@ class GravityRiverModel:
         # Find peaks for placement
         ax2.text(1.5, y[500], "Manifest (Blue)\nStretched", color='blue', ha='center', fontsize=10)
 
-        plt.tight_layout()
-        plt.savefig('gravity_river_viz.png', dpi=300)
-        print("Visualization saved to gravity_river_viz.png")
+        fig.tight_layout()
+        outfile = f'gravity_river_viz.{fmt}'
+        fig.savefig(outfile, dpi=dpi)
+        print(f"Visualization saved to {outfile}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the Gravity River mechanics figure.")
+    parser.add_argument('--publication', action='store_true', help='Save the figure at 300 dpi (default 150)')
+    parser.add_argument('--fmt', choices=['pdf', 'svg', 'png'], default='pdf', help='Output format (default pdf: vector, no rasterization)')
+    args = parser.parse_args()
     river = GravityRiverModel()
-    river.visualize_river_mechanics()
\ No newline at end of file
+    river.visualize_river_mechanics(dpi=300 if args.publication else 150, fmt=args.fmt)
\ No newline at end of file
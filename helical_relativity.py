@@ -1,7 +1,10 @@
+import argparse
+
 import numpy as np
-import matplotlib.pyplot as plt
 
-def verify_helical_dilation():
+from plots import get_fig
+
+def verify_helical_dilation(dpi=150, fmt='pdf'):
     """
     Verifies that the Helical Stitching Model reproduces Special Relativity.
 
@@ -22,19 +25,14 @@ def verify_helical_dilation():
     # v_rot = sqrt(c^2 - v^2)
     # Ratio = (2*pi*A / v_rot) / (2*pi*A / c) = c / v_rot
 
-    helical_ratios = []
-    for v in velocities:
-        # Prevent division by zero at c
-        if v >= C:
-            ratio = np.nan
-        else:
-            v_rot = np.sqrt(C**2 - v**2)
-            ratio = C / v_rot
-        helical_ratios.append(ratio)
+    # Prevent division by zero at c: v >= c is masked to NaN
+    with np.errstate(divide='ignore', invalid='ignore'):
+        v_rot = np.sqrt(C*C - velocities*velocities)
+        helical_ratios = np.where(velocities >= C, np.nan, C / v_rot)
 
     # --- Visualization ---
     # We use a single plot to show the perfect overlap
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = get_fig(figsize=(10, 6))
 
     # Plot Helical Stitch (Thick Green Line)
     ax.plot(velocities, helical_ratios, color='#2ca02c', linewidth=5, alpha=0.6, label='Helical Stitch (Geometric)')
@@ -54,9 +52,14 @@ def verify_helical_dilation():
     ax.text(0.5, 6, "Perfect Overlap confirms:\nGeometric Helix = Lorentz Factor",
             fontsize=12, ha='center', bbox=dict(facecolor='white', alpha=0.9))
 
-    plt.tight_layout()
-    plt.savefig('helical_fix.png', dpi=300)
-    print("Verification plot saved to 'helical_fix.png'.")
+    fig.tight_layout()
+    outfile = f'helical_fix.{fmt}'
+    fig.savefig(outfile, dpi=dpi)
+    print(f"Verification plot saved to '{outfile}'.")
 
 if __name__ == "__main__":
-    verify_helical_dilation()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Verify helical time dilation against the Lorentz factor.")
+    parser.add_argument('--publication', action='store_true', help='Save the figure at 300 dpi (default 150)')
+    parser.add_argument('--fmt', choices=['pdf', 'svg', 'png'], default='pdf', help='Output format (default pdf: vector, no rasterization)')
+    args = parser.parse_args()
+    verify_helical_dilation(dpi=300 if args.publication else 150, fmt=args.fmt)
\ No newline at end of file
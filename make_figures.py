@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""make_figures.py
+
+Regenerates every whitepaper figure in a single Python process, so matplotlib
+is imported once and all plots share one Figure (see plots.py).
+
+Usage:
+    python make_figures.py [--publication] [--fmt pdf|svg|png]
+"""
+
+import argparse
+
+try:
+    from stability import warmup
+except ImportError:  # Numba not installed: vectorized NumPy bisection
+    from stability_numpy import warmup
+from gravity_river import GravityRiverModel
+from helical_relativity import verify_helical_dilation
+from mass_spectrum import analyze_mass_spectrum
+from quantized_spectrum import plot_drift_spectrum
+from predict_phase_shift import build_table, write_table, plot_phase_shifts
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate all whitepaper figures in one process.")
+    parser.add_argument('--publication', action='store_true', help='Save raster output at 300 dpi (default 150)')
+    parser.add_argument('--fmt', choices=['pdf', 'svg', 'png'], default='pdf', help='Output format (default pdf: vector, no rasterization)')
+    args = parser.parse_args()
+    dpi = 300 if args.publication else 150
+
+    warmup()
+    GravityRiverModel().visualize_river_mechanics(dpi=dpi, fmt=args.fmt)
+    verify_helical_dilation(dpi=dpi, fmt=args.fmt)
+    analyze_mass_spectrum(dpi=dpi, fmt=args.fmt)
+    plot_drift_spectrum(fmt=args.fmt)
+
+    df = build_table()
+    write_table(df, 'predict_phase_shift_table.csv')
+    plot_phase_shifts(df, 'phase_shifts.png', dpi=dpi)
+    print("Saved CSV to predict_phase_shift_table.csv and plot to phase_shifts.png")
+
+if __name__ == '__main__':
+    main()
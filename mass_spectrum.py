@@ -1,8 +1,15 @@
+import argparse
+
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.optimize import fsolve
 
-def analyze_mass_spectrum():
+from plots import get_fig
+
+try:
+    from stability import mass_proxy_spectrum, nearest_index, warmup
+except ImportError:  # Numba not installed: vectorized NumPy bisection
+    from stability_numpy import mass_proxy_spectrum, nearest_index, warmup
+
+def analyze_mass_spectrum(dpi=150, fmt='pdf'):
     """
     Analyzes the Geometric Mass Spectrum of the Topological Stitch.
     
@@ -27,45 +34,36 @@ def analyze_mass_spectrum():
     print("-" * 40)
 
     # 2. The Stability Equation Solver
-    def solve_drift(N):
-        # Solves: sqrt(1 - m^2) = m * (pi*N - arccos(-m))
-        func = lambda m: np.sqrt(1 - m**2) - m * (np.pi * N - np.arccos(-m))
-        guess = 1.0 / (np.pi * N)
-        m_sol = fsolve(func, guess)[0]
-        return m_sol
+    # Solves: sqrt(1 - m^2) = m * (pi*N - arccos(-m))  (see stability.py)
 
     # 3. Mass Proxy Calculator
-    def get_mass_proxy(N):
-        m = solve_drift(N)
-        v_rot = np.sqrt(1 - m**2)
-        # Mass Hypothesis: M ~ N * v_rot
-        return N * v_rot
+    # Mass Hypothesis: M ~ N * v_rot, with v_rot = sqrt(1 - m^2)  (see stability.py)
 
-    # 4. Calculate Anchor (Electron)
-    # We established Electron is the first stable matter state (N=3)
-    N_e = 3
-    mass_proxy_e = get_mass_proxy(N_e)
-    
-    # 5. Generate Spectrum
-    # We calculate the mass curve for N=1 to 12,000
-    n_values = np.arange(2, 12000)
-    mass_ratios = []
+    # 4. Generate Spectrum
+    # We calculate the mass curve for N=2 to 12,000
+    n_lo, n_hi = 2, 12000
+    n_values = np.arange(n_lo, n_hi)
+    mass_ratios = np.empty(n_hi - n_lo, dtype=np.float64)
     
     print("Generating Mass Spectrum...")
-    for n in n_values:
-        m_proxy = get_mass_proxy(n)
-        mass_ratios.append(m_proxy / mass_proxy_e)
-    
-    mass_ratios = np.array(mass_ratios)
+    mass_proxy_spectrum(n_lo, n_hi, mass_ratios)
+
+    # 5. Read off the Anchor (Electron)
+    # We established Electron is the first stable matter state (N=3).
+    # Its proxy is already in the sweep, so it is not solved a second time.
+    N_e = 3
+    mass_proxy_e = mass_ratios[N_e - n_lo]
+    # The anchor entry normalizes to exactly 1 (IEEE x/x == 1)
+    mass_ratios /= mass_proxy_e
     
     # 6. Find Matches
     # Muon Match
-    idx_mu = np.argmin(np.abs(mass_ratios - Target_Ratio_Mu))
+    idx_mu = nearest_index(mass_ratios, Target_Ratio_Mu)
     N_mu = n_values[idx_mu]
     ratio_mu = mass_ratios[idx_mu]
     
     # Tau Match
-    idx_tau = np.argmin(np.abs(mass_ratios - Target_Ratio_Tau))
+    idx_tau = nearest_index(mass_ratios, Target_Ratio_Tau)
     N_tau = n_values[idx_tau]
     ratio_tau = mass_ratios[idx_tau]
     
@@ -75,7 +73,7 @@ def analyze_mass_spectrum():
     print(f"Tau Prediction:    N = {N_tau} | Ratio = {ratio_tau:.4f} | Error = {abs(1 - ratio_tau/Target_Ratio_Tau)*100:.4f}%")
 
     # 7. Plotting
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = get_fig(figsize=(12, 7))
     
     # Plot the Curve
     ax.plot(n_values, mass_ratios, color='gray', alpha=0.5, label='Geometric Mass Constraint')
@@ -102,9 +100,15 @@ def analyze_mass_spectrum():
     ax.grid(True, which="both", alpha=0.3)
     ax.legend(fontsize=12)
     
-    plt.tight_layout()
-    plt.savefig('mass_hierarchy.png', dpi=300)
-    print("\nChart saved to mass_hierarchy.png")
+    fig.tight_layout()
+    outfile = f'mass_hierarchy.{fmt}'
+    fig.savefig(outfile, dpi=dpi)
+    print(f"\nChart saved to {outfile}")
 
 if __name__ == "__main__":
-    analyze_mass_spectrum()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Match lepton mass ratios to topological harmonics.")
+    parser.add_argument('--publication', action='store_true', help='Save the figure at 300 dpi (default 150)')
+    parser.add_argument('--fmt', choices=['pdf', 'svg', 'png'], default='pdf', help='Output format (default pdf: vector, no rasterization)')
+    args = parser.parse_args()
+    warmup()
+    analyze_mass_spectrum(dpi=300 if args.publication else 150, fmt=args.fmt)
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""plots.py
+
+Shared figure helper for the plotting scripts.
+
+pyplot is imported on first use only, and a single Figure is cleared and
+reused between saves, so rendering several figures in one process (see
+make_figures.py) pays the matplotlib import and backend setup once.
+"""
+
+_fig = None
+
+
+def get_fig(nrows=1, ncols=1, figsize=(10, 6)):
+    """
+    Returns (fig, axes) laid out on the shared Figure.
+    The previous contents are cleared and the canvas resized to figsize;
+    axes follows plt.subplots (a single Axes for 1x1, otherwise an array).
+    """
+    global _fig
+    if _fig is None:
+        import matplotlib.pyplot as plt
+        _fig = plt.figure(figsize=figsize)
+    else:
+        _fig.clf()
+        _fig.set_size_inches(figsize)
+    axes = _fig.subplots(nrows, ncols)
+    return _fig, axes
@@ -10,16 +10,17 @@ Usage (basic):
     python predict_phase_shift.py
 
 You can also import functions from this module in other scripts:
-    from predict_phase_shift import build_table, plot_phase_shifts
+    from predict_phase_shift import build_table, write_table, plot_phase_shifts
 """
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import argparse
 import sys
 import os
 
+from plots import get_fig
+
 def delta_phi(k_eff, delta_v, T):
     """Compute interferometer phase shift: Delta phi = k_eff * delta_v * T"""
     return k_eff * delta_v * T
@@ -48,34 +49,53 @@ def build_table(delta_v=1e-12, k_eff_factors=[50,100,200], T_values=[0.5,1.0,5.0
             req_shots = required_shots_for_detection(dphi, per_shot_noise, sigma=target_sigma)
             rows.append({
                 "N_LMT": N,
-                "k_eff [1/m]": f"{k_eff:.3e}",
+                "k_eff [1/m]": k_eff,
                 "T [s]": T,
-                "delta_v [m/s]": f"{delta_v:.3e}",
-                "Delta_phi [rad]": f"{dphi:.3e}",
+                "delta_v [m/s]": delta_v,
+                "Delta_phi [rad]": dphi,
                 "per_shot_noise [rad]": per_shot_noise,
                 f"shots_for_{target_sigma}sigma": int(np.ceil(req_shots)) if np.isfinite(req_shots) else np.inf
             })
     df = pd.DataFrame(rows)
     return df
 
-def plot_phase_shifts(df, outfile_png="phase_shifts.png"):
-    """Plot Delta_phi vs T for different k_eff factors."""
-    plt.figure(figsize=(8,5))
+SCI_COLUMNS = ["k_eff [1/m]", "delta_v [m/s]", "Delta_phi [rad]"]
+
+def write_table(df, outfile_csv):
+    """Write the table to CSV, rendering k_eff, delta_v and Delta_phi as %.3e.
+    Columns stay float64 in memory; formatting happens only at write time.
+    """
+    df_out = df.copy()
+    for col in SCI_COLUMNS:
+        df_out[col] = df_out[col].map("{:.3e}".format)
+    df_out.to_csv(outfile_csv, index=False)
+
+def plot_phase_shifts(df, outfile_png="phase_shifts.png", dpi=150):
+    """Plot Delta_phi vs T for different k_eff factors.
+    dpi: 150 for quick renders, 300 for publication figures
+    """
+    fig, ax = get_fig(figsize=(8,5))
     df_plot = df.copy()
-    df_plot["k_eff_factor"] = df_plot["N_LMT"].astype(int)
+    df_plot["k_eff_factor"] = df_plot["N_LMT"].astype(float)
     df_plot["T"] = df_plot["T [s]"].astype(float)
-    df_plot["Delta_phi"] = df_plot["Delta_phi [rad]"].apply(lambda s: float(s))
-    for N, group in df_plot.groupby("k_eff_factor"):
-        plt.plot(group["T"], group["Delta_phi"], marker='o', label=f"N_LMT={N}")
-    plt.xlabel("Interferometer time T [s]")
-    plt.ylabel("Delta phi [rad]")
-    plt.yscale("log")
-    plt.title("Predicted interferometer phase shift for Δv = baseline")
-    plt.grid(True, which="both", ls="--", alpha=0.5)
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(outfile_png, dpi=300)
-    plt.close()
+    df_plot["Delta_phi"] = df_plot["Delta_phi [rad]"]
+    # Wide form: one column per LMT factor, plotted in a single call.
+    # Columns are keyed on the unrounded factor, so 50 and 50.4 stay separate
+    # series; repeated (T, factor) rows (e.g. --T 1 1) are identical by
+    # construction and collapse to one point.
+    df_plot = df_plot.drop_duplicates(subset=["T", "k_eff_factor"])
+    wide = df_plot.pivot(index="T", columns="k_eff_factor", values="Delta_phi")
+    lines = ax.plot(wide.index.to_numpy(), wide.to_numpy(), marker='o')
+    for line, N in zip(lines, wide.columns):
+        line.set_label(f"N_LMT={N:g}")
+    ax.set_xlabel("Interferometer time T [s]")
+    ax.set_ylabel("Delta phi [rad]")
+    ax.set_yscale("log")
+    ax.set_title("Predicted interferometer phase shift for Δv = baseline")
+    ax.grid(True, which="both", ls="--", alpha=0.5)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(outfile_png, dpi=dpi)
 
 def parse_args():
     p = argparse.ArgumentParser(description="Predict interferometer phase shifts and required shots.")
@@ -87,6 +107,7 @@ def parse_args():
     p.add_argument('--sigma', type=float, default=5.0, help='Detection significance in sigma (default 5)')
     p.add_argument('--out_csv', type=str, default='predict_phase_shift_table.csv', help='Output CSV filename')
     p.add_argument('--out_png', type=str, default='phase_shifts.png', help='Output PNG filename')
+    p.add_argument('--publication', action='store_true', help='Save the plot at 300 dpi (default 150)')
     return p.parse_args()
 
 def main():
@@ -94,8 +115,8 @@ def main():
     df = build_table(delta_v=args.delta_v, k_eff_factors=args.k_factors, T_values=args.T,
                      wavelength=args.wavelength, per_shot_noise=args.per_shot_noise,
                      target_sigma=args.sigma)
-    df.to_csv(args.out_csv, index=False)
-    plot_phase_shifts(df, args.out_png)
+    write_table(df, args.out_csv)
+    plot_phase_shifts(df, args.out_png, dpi=300 if args.publication else 150)
     print(f"Saved CSV to {args.out_csv} and plot to {args.out_png}")
 
 if __name__ == '__main__':
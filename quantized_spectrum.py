@@ -1,34 +1,33 @@
+import argparse
+
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.optimize import fsolve
 
-def plot_drift_spectrum():
+from plots import get_fig
+
+try:
+    from stability import solve_drift_vec, warmup
+except ImportError:  # Numba not installed: vectorized NumPy bisection
+    from stability_numpy import solve_drift_vec, warmup
+
+def plot_drift_spectrum(fmt='pdf'):
     """
     Generates the 'Drift Quantization' plot for the whitepaper.
     Visualizes how allowed velocities become continuous as N -> Infinity.
     """
 
     # 1. Solve for Roots (Strict Mode Stability Equation)
-    def equation(m, N):
-        # sqrt(1 - m^2) = m * (pi*N - arccos(-m))
-        return np.sqrt(1 - m**2) - m * (np.pi * N - np.arccos(-m))
-
+    # sqrt(1 - m^2) = m * (pi*N - arccos(-m))  (see stability.py)
     N_values = np.arange(1, 21) # N = 1 to 20
-    m_values = []
-    spacings = []
-
-    for N in N_values:
-        guess = 1.0 / (np.pi * N)
-        # Fix: Pass N as an extra argument to the solver
-        root = fsolve(equation, guess, args=(N,))[0]
-        m_values.append(root)
+    m_values = np.empty(N_values.size, dtype=np.float64)
+    # N=1 is the photon: the closed-form root is m = 1 (v = c)
+    m_values[0] = 1.0
+    solve_drift_vec(N_values[1:], m_values[1:])
 
     # Calculate spacings (Delta v)
-    for i in range(len(m_values) - 1):
-        spacings.append(m_values[i] - m_values[i+1])
+    spacings = -np.diff(m_values)
 
     # 2. Plotting
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    fig, (ax1, ax2) = get_fig(1, 2, figsize=(14, 6))
 
     # Plot A: The Spectrum
     ax1.plot(N_values, m_values, 'o-', color='navy', markersize=6, linewidth=2)
@@ -49,9 +48,14 @@ def plot_drift_spectrum():
     ax2.text(5, 0.01, "Steps shrink as ~1/N²\nRecovers Classical Mechanics",
              fontsize=12, bbox=dict(facecolor='white', alpha=0.8))
 
-    plt.tight_layout()
-    plt.savefig('drift_spectrum_v15.png')
-    print("Plot generated: drift_spectrum_v15.png")
+    fig.tight_layout()
+    outfile = f'drift_spectrum_v15.{fmt}'
+    fig.savefig(outfile)
+    print(f"Plot generated: {outfile}")
 
 if __name__ == "__main__":
-    plot_drift_spectrum()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Plot the quantized drift velocity spectrum.")
+    parser.add_argument('--fmt', choices=['pdf', 'svg', 'png'], default='pdf', help='Output format (default pdf: vector, no rasterization)')
+    args = parser.parse_args()
+    warmup()
+    plot_drift_spectrum(fmt=args.fmt)
\ No newline at end of file
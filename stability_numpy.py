@@ -0,0 +1,58 @@
+"""stability_numpy.py
+
+Pure-NumPy fallback for stability.py, used when Numba is not installed.
+
+Solves the same Stability Equation by vectorized bisection over all N at once,
+and exposes the same entry points (solve_drift_vec, mass_proxy_spectrum,
+nearest_index, warmup) so the figure scripts can swap it in at import time.
+"""
+
+import numpy as np
+
+
+def solve_drift_bisect(n_values, n_iter=60, lo=1e-6, hi=1.0 - 1e-9):
+    """
+    Bisects every N at once, so each step is one sqrt, one arccos and one
+    compare over the whole N array. 60 halvings of the bracket resolve m to
+    below float64 spacing. N = 1 (photon) is returned as the exact root m = 1.
+    """
+    N_arr = np.asarray(n_values, dtype=np.float64)
+    lo = np.full(N_arr.shape, lo)
+    hi = np.full(N_arr.shape, hi)
+    for _ in range(n_iter):
+        mid = 0.5 * (lo + hi)
+        # The residual is decreasing in m: positive means the root lies above mid
+        above = np.sqrt(1.0 - mid * mid) > mid * (np.pi * (N_arr - 1) + np.arccos(mid))
+        lo = np.where(above, mid, lo)
+        hi = np.where(above, hi, mid)
+    return np.where(N_arr == 1, 1.0, 0.5 * (lo + hi))
+
+
+def solve_drift_vec(n_values, out):
+    """Solves the stability equation for every N in n_values into out."""
+    out[:] = solve_drift_bisect(n_values)
+    return out
+
+
+def mass_proxy_spectrum(n_lo, n_hi, out):
+    """Fills out[i] with the mass proxy N * sqrt(1 - m^2) for N = n_lo + i, N < n_hi."""
+    n_values = np.arange(n_lo, n_hi)
+    m = solve_drift_bisect(n_values)
+    np.multiply(n_values, np.sqrt(1.0 - m * m), out=out)
+    return out
+
+
+def nearest_index(values, target):
+    """Index of the entry closest to target in an ascending array."""
+    idx = int(np.searchsorted(values, target))
+    if idx == 0:
+        return 0
+    if idx == values.size:
+        return values.size - 1
+    if target - values[idx - 1] <= values[idx] - target:
+        return idx - 1
+    return idx
+
+
+def warmup():
+    """Nothing to compile on the NumPy path."""